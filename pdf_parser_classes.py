@@ -1,9 +1,85 @@
 import re
-import numpy as np
+from array import array
 from binascii import unhexlify, hexlify
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict,Tuple
 
 
+# Constant patterns compiled once at import time, the parsing hot paths only
+# call .findall()/.search() on them instead of re-compiling per page/tag.
+# All patterns run in bytes mode so they can match directly against an
+# mmap'ed document without materializing it as a str.
+_RE_FONTS = re.compile(rb'/([A-Z][1-9]_[0-9])\s([0-9]+)|/([A-Z]+[1-9])\s([0-9]+)')
+# Matches both bfchar pairs "<src> <dst>" and bfrange triples
+# "<lo> <hi> <dst>", the third group is empty for plain pairs.
+_RE_CMAP_LIST = re.compile(rb'<([a-fA-F0-9]+)> <([a-fA-F0-9]+)>(?: <([a-fA-F0-9]+)>)?')
+# Header of any indirect object, used to index object offsets document-wide.
+_RE_OBJ_HEADER = re.compile(rb'obj\s+([0-9]+)\s+0\s*\n')
+# Stream literals of a content object, searched within its indexed slice.
+_RE_CONTENT_SQ = re.compile(rb"'.*?'")
+_RE_CONTENT_DQ = re.compile(rb'".*?"')
+# PDF numeric operand: optional sign, digits with optional fraction, also
+# covering the bare-fraction forms ".5" and "5." the spec allows.
+_NUMBER = rb'[-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)'
+# Single alternation emitting content-stream tokens (operators, text tags,
+# font selections and numeric operands) in one linear pass.
+_RE_CONTENT_TOKEN = re.compile(rb'BT|ET|Tm|Td|TD|T\*|Tj|TJ|<[0-9a-fA-F]+>|/C2_[0-9]+|' + _NUMBER)
+# Operators whose arrival ends a run of text tags sharing one position,
+# the run is decoded and stored in bulk before the operator applies.
+_FLUSH_OPS = frozenset((b'BT',b'ET',b'Tm',b'Td',b'TD',b'T*'))
+
+
+@lru_cache(maxsize=256)
+def _cmap_ref_pattern(font_ref:bytes):
+    """Pattern locating the ToUnicode reference of a font object."""
+    return re.compile(rb'(obj\s%s\s0\n[a-zA-Z0-9\n\s:,.<_/\[\]+-]+/ToUnicode\s)([0-9]+)' % re.escape(font_ref))
+
+
+@lru_cache(maxsize=256)
+def _cmap_pattern(cmap_ref:bytes):
+    """Pattern locating the cmap stream of a ToUnicode object."""
+    return re.compile(rb"""(obj\s%s\s0\n[a-zA-Z0-9\n\s:,.<>_+-/\[\]\\']+)(nbegincmap.*?nendcmap)""" % re.escape(cmap_ref))
+
+
+@lru_cache(maxsize=256)
+def _content_pattern(contents_ref:bytes, quote:bytes):
+    """Pattern locating the stream literal of a content object."""
+    return re.compile(rb"""(obj\s%s\s0\n[a-zA-Z0-9\n\s:,.<>_+-/\[\]\\()]+)(%s.*?%s)""" % (re.escape(contents_ref), quote, quote))
+
+
+# Document and object index shared by the worker processes, set once per
+# worker through the pool initializer instead of being pickled per page.
+# The cmap cache is per worker: most documents declare the same fonts on
+# every page, so each ToUnicode table is built once rather than per page.
+_worker_document = None
+_worker_obj_index = None
+_worker_cmap_cache = None
+
+
+def _init_worker(pdf_document:bytes, obj_index:Dict)->None:
+    global _worker_document, _worker_obj_index, _worker_cmap_cache
+    _worker_document = pdf_document
+    _worker_obj_index = obj_index
+    _worker_cmap_cache = {}
+
+
+def _parse_page(page:bytes)->str:
+    """
+    Parse one page object against the worker's shared document.
+    #Args:
+        - page: page object
+    #Returns:
+        - Sorted decoded text of the page
+    """
+    pdf_page_manager = PDFPageManager(page, _worker_document, _worker_obj_index,
+                                      _worker_cmap_cache)
+    pdf_content_parser = PDFContentParser(pdf_page_manager)
+    pdf_content_parser.parse()
+    return pdf_content_parser.sorted_decoded_text
+
+
 class PDFDocumentManager:
     """
     PDFDocumentManager is the main class,it parses and converts PDF file 
@@ -13,31 +89,98 @@ class PDFDocumentManager:
       parser = PDFDocumentManager(decompressed_pdf_document)
       parser.parse_document()
     """
-    
-    def __init__(self, pdf_document:str)->None:
+
+    __slots__ = ('pdf_document','page_objects','obj_index','text')
+
+    def __init__(self, pdf_document:bytes)->None:
         """
         #Args:
-        - pdf_document: decompressed pdf document
+        - pdf_document: decompressed pdf document as a bytes-like object
+          (bytes or an mmap mapping, which is paged in on demand)
         """
         self.pdf_document = pdf_document
         # Finds all Page obejcts which are in the following format "obj NUMBER \n Type /Page"
-        self.page_objects = re.findall(
-            re.compile(r"""obj\s[0-9]+\s0\n\sType:\s/Page[a-zA-Z0-9\n\s:,.<>_/\[\]]+Contents[a-zA-Z0-9\n\s:,.<>_/\[\]]+Font[a-zA-Z0-9\n\s:,.<>_/\[\]]+"""),
-            pdf_document)
+        self.page_objects = self._find_page_objects(pdf_document)
+        # One scan over the document indexing every object's slice, so the
+        # per-page lookups never rescan the whole document again
+        self.obj_index = self._build_object_index(pdf_document)
         self.text = ''
+
+    @staticmethod
+    def _build_object_index(pdf_document:bytes)->Dict[int,Tuple[int,int]]:
+        """
+        Index the offsets of all indirect objects in a single pass.
+        #Args:
+            - pdf_document: decompressed pdf document
+        #Returns:
+            - Dict mapping object number to the (start,end) slice of its
+              body, bounded by the "endobj" terminator
+        """
+        obj_index = {}
+        find = pdf_document.find
+        n = len(pdf_document)
+        for match in _RE_OBJ_HEADER.finditer(pdf_document):
+            start = match.end()
+            end = find(b'endobj', start)
+            if end == -1:
+                end = n
+            obj_index[int(match.group(1))] = (start, end)
+        return obj_index
+
+    @staticmethod
+    def _find_page_objects(pdf_document:bytes)->List[bytes]:
+        """
+        Locate all Page objects with a single linear scan.
+        A Page object starts with "obj NUMBER 0\n Type: /Page" and must
+        reference Contents and Font entries before its "endobj" terminator.
+        #Args:
+            - pdf_document: decompressed pdf document
+        #Returns:
+            - List of Page objects as bytes
+        """
+        anchor = b' 0\n Type: /Page'
+        pages = []
+        find = pdf_document.find
+        n = len(pdf_document)
+        pos = 0
+        while True:
+            start = find(b'obj ', pos)
+            if start == -1:
+                break
+            # skip over the object number
+            i = start + 4
+            while i < n and 0x30 <= pdf_document[i] <= 0x39:
+                i += 1
+            if i == start + 4 or pdf_document[i:i+len(anchor)] != anchor:
+                pos = start + 4
+                continue
+            end = find(b'endobj', i)
+            if end == -1:
+                end = n
+            # only keep pages referencing Contents and Font entries
+            contents_idx = find(b'Contents', i, end)
+            if contents_idx != -1 and find(b'Font', contents_idx, end) != -1:
+                pages.append(pdf_document[start:end])
+            pos = end
+        return pages
         
     def parse_document(self):
         """
         Parse the entire pdf document.
+        Pages are fully independent of each other, so they are dispatched
+        across worker processes; a single-page document is parsed inline
+        to avoid the pool startup cost.
         """
-        entire_pages_text = ''
-        for page in self.page_objects:
-            pdf_page_manager = PDFPageManager(page,self.pdf_document)
-            pdf_content_parser = PDFContentParser(pdf_page_manager)
-            pdf_content_parser.parse()
+        if len(self.page_objects) <= 1:
+            _init_worker(self.pdf_document, self.obj_index)
+            self.text = ''.join(_parse_page(page) for page in self.page_objects)
+            return
 
-            entire_pages_text += pdf_content_parser.sorted_decoded_text
-        self.text = entire_pages_text
+        # an mmap mapping is not picklable, ship the document to each
+        # worker once as bytes through the pool initializer
+        document = bytes(self.pdf_document)
+        with ProcessPoolExecutor(initializer=_init_worker,initargs=(document,self.obj_index)) as executor:
+            self.text = ''.join(executor.map(_parse_page, self.page_objects, chunksize=4))
 
 
 
@@ -53,14 +196,24 @@ class PDFPageManager:
     #Usage:
         pdf_page_manager = PDFPageManager(page_object,decompressed_pdf_document)
     """
-    
-    def __init__(self, page:str, pdf_document:str):
+
+    __slots__ = ('page','obj_index','cmap_cache','fonts_mapping_dict','contents',
+                 'cropbox_x','cropbox_y')
+
+    def __init__(self, page:bytes, pdf_document:bytes, obj_index:Dict=None,
+                 cmap_cache:Dict=None):
         """
         #Args:
         - page: page object
-        - pdf_document: decompressed pdf document
+        - pdf_document: decompressed pdf document as a bytes-like object
+        - obj_index: optional document-wide object offset index built by
+          PDFDocumentManager, avoids rescanning the document per page
+        - cmap_cache: optional {font_ref: cmap table} cache shared across
+          pages, most documents reuse the same fonts on every page
         """
         self.page = page
+        self.obj_index = obj_index
+        self.cmap_cache = cmap_cache if cmap_cache is not None else {}
         self.fonts_mapping_dict = self.get_fonts_mapping_dict(pdf_document)
         self.contents = self.get_content(pdf_document)
         self.cropbox_x,self.cropbox_y = self.get_cropbox()
@@ -72,13 +225,12 @@ class PDFPageManager:
         #Returns:
             - Dict containing fonts objects reference numbers
         """
-        fonts_ref = {' '.join(font).split()[0]:' '.join(font).split()[1] 
-                 for font in re.findall('/([A-Z][1-9]_[0-9])\s([0-9]+)|/([A-Z]+[1-9])\s([0-9]+)',
-                                self.page.split("/Font\n")[-1].split('>>')[0])}
+        fonts_ref = {b' '.join(font).split()[0]:b' '.join(font).split()[1]
+                 for font in _RE_FONTS.findall(self.page.split(b"/Font\n")[-1].split(b'>>')[0])}
         return fonts_ref
     
     
-    def __get_cmap(self, font_ref:str,pdf_document:str)->Dict:
+    def __get_cmap(self, font_ref:bytes,pdf_document:bytes)->Dict:
         """
         Retrieve ToUnicode table -Type 0- for a given font.
         #Args:
@@ -87,18 +239,42 @@ class PDFPageManager:
         #Returns:
             - ToUnicode table saved in a dictionary
         """
+        cached = self.cmap_cache.get(font_ref)
+        if cached is not None:
+            return cached
+
         # Finding cmap reference associated to a specific font
-        cmap_ref = re.findall(re.compile(fr'(obj\s{font_ref}\s0\n[a-zA-Z0-9\n\s:,.<_/\[\]+-]+/ToUnicode\s)([0-9]+)'),pdf_document)[0][1]
+        match = _cmap_ref_pattern(font_ref).search(pdf_document)
+        if match is None:
+            raise PDFSyntaxError('No ToUnicode reference in font object %s' % font_ref.decode())
+        cmap_ref = match.group(2)
 
         # Traverse to cmap object and retrieve the cmap and save it into a dictionary
-        cmap = re.findall(re.compile(fr"""(obj\s{cmap_ref}\s0\n[a-zA-Z0-9\n\s:,.<>_+-/\[\]\\']+)(nbegincmap.*?nendcmap)"""),pdf_document)[0][1]
-        cmap_as_list = re.findall(re.compile('<[a-fA-F0-9]+> <[a-fA-F0-9]+>'), cmap)
+        match = _cmap_pattern(cmap_ref).search(pdf_document)
+        if match is None:
+            raise PDFSyntaxError('No cmap stream in object %s' % cmap_ref.decode())
+        cmap = match.group(2)
 
-        return {encode.split()[0].replace('<','').replace('>',''):unhexlify(encode.split()[1].replace('<','').replace('>','')).decode('utf-16-be') 
-                          for encode in cmap_as_list}
+        # Key on the integer value of the 2-byte code so decoding can look up
+        # raw byte pairs directly instead of slicing 4-hex-char substrings
+        table = {}
+        for first, second, third in _RE_CMAP_LIST.findall(cmap):
+            if third:
+                # bfrange: codes lo..hi map to consecutive unicode values
+                lo = int.from_bytes(unhexlify(first),'big')
+                hi = int.from_bytes(unhexlify(second),'big')
+                base = int.from_bytes(unhexlify(third),'big')
+                width = len(third)//2
+                for offset in range(hi - lo + 1):
+                    table[lo+offset] = (base+offset).to_bytes(width,'big').decode('utf-16-be')
+            else:
+                # bfchar: a single code to unicode entry
+                table[int.from_bytes(unhexlify(first),'big')] = unhexlify(second).decode('utf-16-be')
+        self.cmap_cache[font_ref] = table
+        return table
         
     
-    def get_fonts_mapping_dict(self, pdf_document:str)->Dict:
+    def get_fonts_mapping_dict(self, pdf_document:bytes)->Dict:
         """
         Retrieve ToUnicode tables for all fonts referenced by the page.
         and save it in a dictionary.
@@ -115,34 +291,43 @@ class PDFPageManager:
         return fonts_mapping_dict
 
     
-    def get_content(self, pdf_document:str)->str:
+    def get_content(self, pdf_document:bytes)->bytes:
         """
         Retrive content obejct
         #Args:
             - pdf_document: decompressed pdf file
         #Returns:
-            - Page content as a string 
+            - Page content as bytes
         """
-        contents_ref = self.page.split('Contents ')[1].split(' ')[0]
-        try:
-            content = re.findall(re.compile(fr"""(obj\s{contents_ref}\s0\n[a-zA-Z0-9\n\s:,.<>_+-/\[\]\\()]+)('.*?')"""),pdf_document)[0][1]
-        except:
-            try:
-                content = re.findall(re.compile(fr"""(obj\s{contents_ref}\s0\n[a-zA-Z0-9\n\s:,.<>_+-/\[\]\\()]+)(".*?")"""),pdf_document)[0][1]
-            except:
-                raise PDFSyntaxError('Content object syntax error '%contents_ref)
-                
+        contents_ref = self.page.split(b'Contents ')[1].split(b' ')[0]
+        span = self.obj_index.get(int(contents_ref)) if self.obj_index else None
+        if span is not None:
+            # indexed path: search only within the object's own slice
+            blob = pdf_document[span[0]:span[1]]
+            match = _RE_CONTENT_SQ.search(blob)
+            if match is None:
+                match = _RE_CONTENT_DQ.search(blob)
+            if match is None:
+                raise PDFSyntaxError('Content object %s syntax error' % contents_ref.decode())
+            return match.group(0)
 
-        return content
+        match = _content_pattern(contents_ref, b"'").search(pdf_document)
+        if match is None:
+            match = _content_pattern(contents_ref, b'"').search(pdf_document)
+        if match is None:
+            raise PDFSyntaxError('Content object %s syntax error' % contents_ref.decode())
+
+        return match.group(2)
 
     
     def get_cropbox(self)->Tuple[float,float]:
         """
         Get x and y coordinates of the visible region for default user space
         """
-        cropbox_x = float(re.findall('[\d+\.\d+]+', self.page.split('/CropBox')[1])[:4][-2])
-        cropbox_y = float(re.findall('[\d+\.\d+]+', self.page.split('/CropBox')[1])[:4][-1])
-        return cropbox_x,cropbox_y
+        after = self.page.split(b'/CropBox', 1)[1]
+        inside = after[after.index(b'[')+1 : after.index(b']')]
+        values = inside.split()[:4]
+        return float(values[-2]),float(values[-1])
     
 
     
@@ -154,116 +339,62 @@ class PDFContentParser:
     that is contained in each page and has instructions
     for rendering the page.
     """
-    
+
+    __slots__ = ('PdfResourceManager','_aff','Tl',
+                 'text_with_coordinates','sorted_decoded_text')
+
     def __init__(self, PdfResourceManager):
         self.PdfResourceManager = PdfResourceManager
-        self.Tm = np.array([[1,0,0],  # Initial value -PDF specification- 
-                           [0,1,0],
-                           [0,0,1]])
+        # Text matrix kept as the six scalars (a,b,c,d,e,f) of the affine
+        # transform [[a,b,0],[c,d,0],[e,f,1]] in one contiguous buffer,
+        # initial value -PDF specification-
+        self._aff = array('d', (1.0, 0.0, 0.0, 1.0, 0.0, 0.0))
         self.Tl = 0                   # Initial value: 0 -PDF specification-
-        self.text_with_coordinates = dict()
+        self.text_with_coordinates = defaultdict(dict)
         self.sorted_decoded_text = ""
         
         
-    def get_text_matrices(self, bt:str)->None:
-        """
-        Get and updated text matrix.             
-        #Arg:
-            - bt: BT tags or text string "TJ/j tags"
-
-        """
-
-        if 'Tm' in bt:
-            Tm_new = bt.split('Tm')[0].split('\\n')[-1]
-            a,b,c,d,e,f = list(map(float,Tm_new.split()[-6:]))
-            
-            self.Tm = np.array([[a,b,0],#     - a: horizontal scale          - b: vertical scale
-                                 [c,d,0],#    - c: horizontal rotation       - d: vertical rotation
-                                [e,f,1]])#    - e: horizontal position "x"   - f: vertical position "y"
-        else:
-            pass
-        
-        
-    def get_text_coordinate(self, Tj:str)->None:
-        """
-        Get corresponding text coordinates and update 
-        text matrix "Tm" and text leading "Tl"
-        #Arg:
-            - Tj: Text string either Tj or TJ
-        """
-        if 'Td' in Tj:
-            for Td in Tj.split(' Td')[:-1]:
-                # find x and y 
-                Tx = float(Td.split('\\n')[-1].split()[-2])
-                Ty = float(Td.split('\\n')[-1].split()[-1])
-                Tlm = np.array([[1,0,0],
-                                [0,1,0],
-                                [Tx,Ty,1]])
-                self.Tm =  Tlm.dot(self.Tm)  
-
-        elif 'TD' in Tj:
-            for TD in Tj.split(' TD')[:-1]:
-                # update text leading
-                self.Tl = float(TD.split('\\n')[-1].split()[-1])
-                # find x and y 
-                Tx = float(TD.split('\\n')[-1].split()[-2])
-                Ty = float(TD.split('\\n')[-1].split()[-1])
-                Tlm = np.array([[1,0,0],
-                                [0,1,0],
-                                [Tx,Ty,1]])
-                self.Tm = Tlm.dot(self.Tm)
-
-        elif 'T*' in Tj:
-            Tx =0 
-            Ty = self.Tl
-            Tlm = np.array([[1,0,0],
-                            [0,1,0],
-                            [Tx,Ty,1]])
-            self.Tm = Tlm.dot(self.Tm)
-            
-    def decode_content(self, tag:str,used_font:str)->str:
+    def decode_content(self, hex_payload:bytes,table:Dict)->str:
         """
         #Args:
-            - tag: text tags.i.e. <XXXX> inside a Tj/J
-            - used_font: The arible name of the font used in the encode the text
+            - hex_payload: concatenated hex digits of one or more <XXXX>
+              text tags sharing the same position
+            - table: cmap table of the font used to encode the text
         #Return:
             - Decoded text
         """
-        fonts_mapping_dic = self.PdfResourceManager.fonts_mapping_dict
-        
-        decoded_text = ""
-        tag = tag.replace("<","")
-        tag = tag.replace(">","")
-        for i in range(0,len(tag), 4):
-            try:
-                decoded_text= fonts_mapping_dic[used_font][tag[i:i+4]]+ decoded_text
-            except:
-                pass
-        return decoded_text
+        if table is None:
+            return ''
+
+        try:
+            raw = unhexlify(hex_payload)
+        except:
+            return ''
+        decoded_text = []
+        table_get = table.get
+        for i in range(0,len(raw)-1, 2):
+            decoded_text.append(table_get((raw[i]<<8)|raw[i+1], ''))
+        return ''.join(reversed(decoded_text))
     
     
     
         
-    def store_text_with_coordinates(self, text:str)->None:
+    def store_text_with_coordinates(self, text:str, Tx:float, Ty:float)->None:
         """
-        Store decoded text into a dictionary to position text 
+        Store decoded text into a dictionary to position text
         into its right palce i.e {y:{x:text}}
         #Args:
             - text: decoded text(readable text)
+            - Tx: horizontal position, represent offset in a line
+            - Ty: vertical position, represent line
         #Return:
             None, It applys changes directly to the dictionary
         """
-        Tx = self.Tm[2][0] #Tx: represent offset in a line
-        Ty = self.Tm[2][1] #Ty:represent line
-        if (Tx > 0 and Ty > 0):
-            Tx = int(Tx)
-            Ty = int(Ty)
-
-            y = self.text_with_coordinates.setdefault(Ty,{})
-            try:
-                y[Tx] = text +y[Tx]
-            except:
-                x = y.setdefault(Tx,text)
+        if text and Tx > 0.0 and Ty > 0.0:
+            # compare on the floats first, convert only when storing
+            row = self.text_with_coordinates[int(Ty)]
+            ix = int(Tx)
+            row[ix] = text + row[ix] if ix in row else text
                 
                 
 
@@ -272,55 +403,86 @@ class PDFContentParser:
         Sort the dictionary {y:{x:text}} and position text into their right palces and
         save it as a string.
         """
-        text = ""
+        parts = []
 
-        for line in sorted(self.text_with_coordinates,reverse =True):
-            for word in sorted(self.text_with_coordinates[line],reverse =True):
-                text += self.text_with_coordinates[line][word]
-        self.sorted_decoded_text = text
+        for line,row in sorted(self.text_with_coordinates.items(),reverse =True):
+            parts.extend(word_text for word,word_text in sorted(row.items(),reverse =True))
+        self.sorted_decoded_text = ''.join(parts)
     
     
     
     def parse(self)->None:
         """
         Parse string streams in the content object.
+        Runs a small state machine over the tokens emitted by a single
+        _RE_CONTENT_TOKEN pass: numeric operands are buffered until the
+        operator consuming them (Tm/Td/TD) arrives, text tags are decoded
+        and stored with the coordinates in effect at that point.
         """
         content = self.PdfResourceManager.contents
-        BTs = content.split("BT")
-        used_font = None
-        for j in range(1,len(BTs)):
-            bt = BTs[j]
-            
-             # 1- Finding text string in TJ 
-            for Tj in bt.split('Tj'):
-                if 'TJ' in Tj:
-                    for TJ in Tj.split('TJ')[:-1]:
-                        try:
-                            used_font = re.findall(re.compile(r"""(C2_[0-9]+)\s"""), TJ)[0]
-                        except:
-                            pass
-                        # Update text metrics
-                        self.get_text_matrices(TJ)               
-                        self.get_text_coordinate(TJ)
-                        # Finding text strings
-                        text_tags = re.findall("<[0-9a-fA-F]+>", TJ)
-                        for text_tag in text_tags:
-                            text = self.decode_content(text_tag,used_font)
-                            self.store_text_with_coordinates(text)
-
-                # 2- Finding text string in Tj
-                Tj_ = Tj.split('TJ')[-1]
-                try:
-                    used_font = re.findall(re.compile(r"""(C2_[0-9]+)\s"""), Tj_)[0]
-                except:
-                    pass
-
-                # Get text metrics
-                self.get_text_matrices(Tj_)
-                self.get_text_coordinate(Tj_)
-                # Finding text strings
-                text_tags = re.findall("<[0-9a-fA-F]+>", Tj_)
-                for text_tag in text_tags:
-                    text = self.decode_content(text_tag,used_font)
-                    self.store_text_with_coordinates(text)
+        fonts_mapping_dict = self.PdfResourceManager.fonts_mapping_dict
+        # cmap of the font in use, re-resolved only when a /C2_n token
+        # switches fonts rather than once per text tag
+        current_table = None
+        in_text = False
+        numbers = []
+        # hex payloads of consecutive text tags at the current position,
+        # decoded in one bulk pass when a state-changing operator arrives
+        pending_tags = []
+        # affine state and text leading live in locals for the duration of
+        # the loop, the interpreter resolves those far faster than attributes
+        a,b,c,d,e,f = self._aff
+        Tl = self.Tl
+        for match in _RE_CONTENT_TOKEN.finditer(content):
+            token = match.group()
+            if pending_tags and (token in _FLUSH_OPS or token[:1] == b'/'):
+                text = self.decode_content(b''.join(pending_tags),current_table)
+                self.store_text_with_coordinates(text,e,f)
+                del pending_tags[:]
+            if token == b'BT':
+                # entering a text object resets the text state -PDF specification-
+                a,b,c,d,e,f = 1.0,0.0,0.0,1.0,0.0,0.0
+                Tl = 0
+                del numbers[:]
+                in_text = True
+            elif not in_text:
+                continue
+            elif token == b'ET':
+                in_text = False
+            elif token == b'Tm':
+                if len(numbers) >= 6:
+                    #     - a: horizontal scale          - b: vertical scale
+                    #     - c: horizontal rotation       - d: vertical rotation
+                    #     - e: horizontal position "x"   - f: vertical position "y"
+                    a,b,c,d,e,f = numbers[-6:]
+                del numbers[:]
+            elif token == b'Td' or token == b'TD':
+                if len(numbers) >= 2:
+                    Tx,Ty = numbers[-2:]
+                    if token == b'TD':
+                        # update text leading
+                        Tl = Ty
+                    # translation composed onto Tm reduces to updating e and f
+                    e = Tx*a + Ty*c + e
+                    f = Tx*b + Ty*d + f
+                del numbers[:]
+            elif token == b'T*':
+                e = Tl*c + e
+                f = Tl*d + f
+                del numbers[:]
+            elif token == b'Tj' or token == b'TJ':
+                del numbers[:]
+            elif token[:1] == b'<':
+                pending_tags.append(token[1:-1])
+                del numbers[:]
+            elif token[:1] == b'/':
+                current_table = fonts_mapping_dict.get(token[1:])
+            else:
+                # _NUMBER only matches well-formed numerals, float cannot fail
+                numbers.append(float(token))
+        if pending_tags:
+            text = self.decode_content(b''.join(pending_tags),current_table)
+            self.store_text_with_coordinates(text,e,f)
+        self._aff = array('d', (a,b,c,d,e,f))
+        self.Tl = Tl
         self.arranging_text()